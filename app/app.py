@@ -9,6 +9,7 @@ from streamlit import session_state as ss
 
 import db_utils
 from core.config import load_settings
+from core.database import scoped_connection
 from llms import load_secrets_fron_env
 from pg_agents import PageAgents
 from pg_crews import PageCrews
@@ -44,19 +45,30 @@ def pages() -> Dict[str, Page]:
 
 
 def load_data() -> None:
-    """Populate the Streamlit session state with persisted entities."""
+    """Populate the Streamlit session state with persisted entities.
+
+    The entities are kept in the session across reruns and only reloaded once
+    a write has changed :func:`db_utils.entities_version`. ``st.cache_data``
+    is deliberately avoided as it would share the objects between sessions.
+    """
+
+    generation = db_utils.entities_version()
+    if "loaded_entities" in ss and ss.get("_entities_gen") == generation:
+        return
 
     loaded = db_utils.load_all_entities()
+    ss.loaded_entities = loaded
+    ss["_entities_gen"] = generation
     ss.agents = loaded.agents
     ss.tasks = loaded.tasks
     ss.crews = loaded.crews
     ss.tools = loaded.tools
-    ss.enabled_tools = db_utils.load_tools_state()
+    ss.enabled_tools = loaded.enabled_tools
     ss.knowledge_sources = loaded.knowledge_sources
 
 
 def draw_sidebar() -> None:
-    """Render the navigation sidebar and handle page changes."""
+    """Render the navigation sidebar bound to the current page."""
 
     with st.sidebar:
         st.image("img/crewai_logo.png")
@@ -64,22 +76,27 @@ def draw_sidebar() -> None:
         if "page" not in ss:
             ss.page = "Crews"
 
-        labels = list(pages().keys())
-        selected_page = st.radio(
+        # Bound to ``ss.page`` through its key, so a selection is already
+        # visible to the run it triggers and needs no extra ``st.rerun()``.
+        st.radio(
             "Page",
-            labels,
-            index=labels.index(ss.page),
+            list(pages().keys()),
+            key="page",
             label_visibility="collapsed",
         )
-        if selected_page != ss.page:
-            ss.page = selected_page
-            st.rerun()
+
+
+@lru_cache(maxsize=1)
+def load_environment() -> None:
+    """Read the ``.env`` file into the process environment once per process."""
+
+    load_dotenv()
 
 
 def configure_environment() -> None:
     """Load environment settings and initialise optional integrations."""
 
-    load_dotenv()
+    load_environment()
     load_secrets_fron_env()
     settings = load_settings()
 
@@ -103,8 +120,10 @@ def main() -> None:
         page_title="CrewAI Studio", page_icon="img/favicon.ico", layout="wide"
     )
     configure_environment()
-    db_utils.initialize_db()
-    load_data()
+    # Share a single pooled connection across the start-up queries.
+    with scoped_connection():
+        db_utils.initialize_db()
+        load_data()
     draw_sidebar()
 
     # Persist the session state for the crew run page so crew run can execute in a
@@ -1,10 +1,19 @@
 """Core helpers shared across the CrewAI Studio application."""
 
 from .config import load_settings
-from .database import get_db_connection, get_engine
+from .database import (
+    autocommit_connection,
+    get_db_connection,
+    get_engine,
+    scoped_connection,
+    sqlite_data_version,
+)
 
 __all__ = [
+    "autocommit_connection",
     "get_db_connection",
     "get_engine",
     "load_settings",
+    "scoped_connection",
+    "sqlite_data_version",
 ]
@@ -1,26 +1,138 @@
 """Database helpers built on top of SQLAlchemy."""
 
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
-from typing import Iterator
+from typing import Any, Dict, Iterator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import QueuePool
 
 from .config import load_settings
 
+_current_conn: ContextVar[Optional[Connection]] = ContextVar("conn", default=None)
+
+# Bound on first use so hot paths skip the ``lru_cache`` wrapper of get_engine().
+_ENGINE: Optional[Engine] = None
+
+# Dedicated, never-writing connection used to probe ``PRAGMA data_version``.
+_version_conn: Optional[Connection] = None
+_version_lock = threading.Lock()
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Return pool configuration suited to the database backend."""
+
+    if _is_sqlite(url):
+        if ":memory:" in url or url.rstrip("/") == "sqlite:":
+            # Every pooled connection would see its own empty in-memory
+            # database, so keep SQLAlchemy's default single-connection pool.
+            return {"connect_args": {"check_same_thread": False}}
+        return {
+            "poolclass": QueuePool,
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {
+        "poolclass": QueuePool,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+    }
+
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """Enable WAL journaling so frequent small commits stay cheap."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
 
 @lru_cache(maxsize=1)
 def get_engine() -> Engine:
     """Return the shared SQLAlchemy engine instance."""
 
     settings = load_settings()
-    return create_engine(settings.database.url, echo=settings.database.echo, future=True)
+    url = settings.database.url
+    engine = create_engine(
+        url, echo=settings.database.echo, future=True, **_engine_options(url)
+    )
+    if _is_sqlite(url):
+        event.listen(engine, "connect", _configure_sqlite)
+    return engine
 
 
 def get_db_connection() -> Connection:
     """Provide a raw SQLAlchemy connection."""
 
-    return get_engine().connect()
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = get_engine()
+    return _ENGINE.connect()
+
+
+def autocommit_connection() -> Connection:
+    """Provide a connection that commits each statement as it executes.
+
+    Suited to one-shot writes, which then skip the explicit BEGIN/COMMIT
+    round-trip.
+    """
+
+    return get_db_connection().execution_options(isolation_level="AUTOCOMMIT")
+
+
+@contextmanager
+def scoped_connection() -> Iterator[Connection]:
+    """Share one connection with every nested ``scoped_connection`` call.
+
+    The outermost block checks a connection out of the pool and publishes it
+    through a context variable; nested blocks reuse it instead of opening
+    their own. The connection is closed when the outermost block exits.
+    """
+
+    conn = _current_conn.get()
+    if conn is not None:
+        yield conn
+        return
+
+    with get_db_connection() as conn:
+        token = _current_conn.set(conn)
+        try:
+            yield conn
+        finally:
+            _current_conn.reset(token)
+
+
+def sqlite_data_version() -> Optional[int]:
+    """Return SQLite's ``PRAGMA data_version`` or ``None`` for other backends.
+
+    The counter only moves when *another* connection commits and is not
+    comparable across connections, so it is always read through the same
+    long-lived probe connection, which never writes.
+    """
+
+    global _version_conn
+    with _version_lock:
+        if _version_conn is None:
+            engine = get_engine()
+            if engine.dialect.name != "sqlite":
+                return None
+            _version_conn = engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        return _version_conn.exec_driver_sql("PRAGMA data_version").scalar()
 
 
 def iter_rows(result_proxy) -> Iterator[dict]:
@@ -3,12 +3,40 @@
 from __future__ import annotations
 
 import json
+import re
+import threading
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
-
-from sqlalchemy import text
-
-from core.database import get_db_connection, iter_rows
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    MetaData,
+    String,
+    Table,
+    Text,
+    bindparam,
+    inspect,
+    text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+from core.database import (
+    autocommit_connection,
+    get_db_connection,
+    iter_rows,
+    scoped_connection,
+    sqlite_data_version,
+)
+
+try:  # pragma: no cover - optional accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
 
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
     from my_agent import MyAgent
@@ -19,6 +47,181 @@ if TYPE_CHECKING:  # pragma: no cover - imported for typing only
     from result import Result
 
 
+IMPORT_BATCH_SIZE = 500
+
+# Parsed payloads keyed by entity id, stored with the raw JSON text they were
+# decoded from. Comparing the text also catches writes that bypass this
+# module (older releases, manual SQL), which leave ``updated_at`` untouched.
+_parsed_cache: Dict[str, Tuple[str, Dict]] = {}
+
+# Set once initialize_db has created or migrated the schema in this process.
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+# Bumped after every write so callers can tell whether cached entities are stale.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _bump_generation() -> None:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+def data_generation() -> int:
+    """Return a counter that changes whenever this process writes entities."""
+
+    return _generation
+
+
+EntitiesVersion = Tuple[int, Optional[int]]
+
+# Rows from the last grouped load, shared by every session in the process.
+_grouped_cache: Optional[Tuple[EntitiesVersion, Dict[str, List[Tuple[str, Dict]]]]] = None
+
+
+def entities_version() -> EntitiesVersion:
+    """Return a token that changes whenever any process commits entities.
+
+    Combines :func:`data_generation` with SQLite's ``data_version``, which
+    also catches commits made by other processes. Other backends only report
+    writes made by this process.
+    """
+
+    return data_generation(), sqlite_data_version()
+
+
+# orjson only reads integers in [-2**63, 2**64 - 1] exactly and turns wider
+# ones into floats; any run of 19+ digits routes the payload to ``json``.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def _dumps(data: Any) -> str:
+    """Serialise ``data`` to compact JSON text, preferring ``orjson`` when installed.
+
+    orjson writes ``NaN``/``Infinity`` as ``null`` and refuses integers wider
+    than 64 bits, so its output is only used when it reads back as ``data``;
+    the stdlib encoder handles everything else exactly as before.
+    """
+
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            encoded = None
+        if encoded is not None and orjson.loads(encoded) == data:
+            return encoded.decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _loads(raw: Union[str, bytes]) -> Any:
+    """Parse JSON text, preferring ``orjson`` when installed."""
+
+    long_digits = _LONG_DIGITS_BYTES if isinstance(raw, bytes) else _LONG_DIGITS
+    if orjson is not None and long_digits.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Payloads written by the stdlib may contain ``NaN``/``Infinity``,
+            # which orjson rejects; ``json`` still reads them.
+            pass
+    return json.loads(raw)
+
+
+_CREATE_SQL = text(
+    """
+    CREATE TABLE IF NOT EXISTS entities (
+        id TEXT PRIMARY KEY,
+        entity_type TEXT,
+        data TEXT,
+        updated_at BIGINT,
+        created_at TEXT
+    )
+    """
+)
+# Serves both the per-type lookups and their ``created_at`` ordering.
+_CREATE_TYPE_INDEX_SQL = text(
+    "CREATE INDEX IF NOT EXISTS idx_entities_type_created "
+    "ON entities (entity_type, created_at)"
+)
+_DROP_LEGACY_TYPE_INDEX_SQL = text("DROP INDEX IF EXISTS idx_entities_type")
+_ADD_UPDATED_AT_SQL = text("ALTER TABLE entities ADD COLUMN updated_at BIGINT")
+_ADD_CREATED_AT_SQL = text("ALTER TABLE entities ADD COLUMN created_at TEXT")
+_SELECT_ALL_DATA_SQL = text("SELECT id, data FROM entities")
+_BACKFILL_CREATED_AT_SQL = text(
+    "UPDATE entities SET created_at = :created_at WHERE id = :id"
+)
+_SELECT_LEGACY_SQL = text("SELECT id, data FROM entities WHERE updated_at IS NULL")
+_REPACK_SQL = text(
+    "UPDATE entities SET data = :data, updated_at = :updated_at WHERE id = :id"
+)
+_SELECT_BY_TYPE_SQL = text(
+    "SELECT id, data FROM entities WHERE entity_type = :etype "
+    "ORDER BY created_at"
+)
+_SELECT_BY_TYPE_DESC_SQL = text(
+    "SELECT id, data FROM entities WHERE entity_type = :etype "
+    "ORDER BY created_at DESC"
+)
+# Entity types consumed by load_all_entities. Results are left out on purpose:
+# their payloads hold full crew outputs and are loaded on demand instead.
+_GROUPED_ENTITY_TYPES = (
+    "tool",
+    "knowledge_source",
+    "agent",
+    "task",
+    "crew",
+    "tools_state",
+)
+_SELECT_GROUPED_SQL = text(
+    "SELECT id, entity_type, data FROM entities "
+    "WHERE entity_type IN :etypes ORDER BY entity_type, created_at"
+).bindparams(bindparam("etypes", expanding=True))
+_DELETE_SQL = text("DELETE FROM entities WHERE id = :id AND entity_type = :etype")
+_EXPORT_SQL = text("SELECT id, entity_type, data FROM entities").execution_options(
+    stream_results=True
+)
+
+_entities = Table(
+    "entities",
+    MetaData(),
+    Column("id", String, primary_key=True),
+    Column("entity_type", String),
+    Column("data", Text),
+    Column("updated_at", BigInteger),
+    Column("created_at", String),
+)
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+@lru_cache(maxsize=None)
+def _upsert_statement(dialect_name: str):
+    """Return the ``entities`` upsert for ``dialect_name``, built once per dialect."""
+
+    try:
+        insert = _DIALECT_INSERTS[dialect_name]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported database dialect for entity storage: {dialect_name}"
+        ) from None
+    stmt = insert(_entities)
+    return stmt.on_conflict_do_update(
+        index_elements=[_entities.c.id],
+        set_={
+            "entity_type": stmt.excluded.entity_type,
+            "data": stmt.excluded.data,
+            "updated_at": stmt.excluded.updated_at,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+
+
 @dataclass
 class LoadedEntities:
     """Aggregate container returned by :func:`load_all_entities`."""
@@ -28,71 +231,163 @@ class LoadedEntities:
     crews: Sequence["MyCrew"]
     tools: Sequence["MyTool"]
     knowledge_sources: Sequence["MyKnowledgeSource"]
+    enabled_tools: Dict[str, bool]
 
 
 def initialize_db() -> None:
-    """Initialise the storage by ensuring the ``entities`` table exists."""
-
-    create_sql = text(
-        """
-        CREATE TABLE IF NOT EXISTS entities (
-            id TEXT PRIMARY KEY,
-            entity_type TEXT,
-            data TEXT
-        )
-        """
-    )
-    with get_db_connection() as conn:
-        conn.execute(create_sql)
-        conn.commit()
+    """Initialise the storage by ensuring the ``entities`` table exists.
+
+    The schema check and migrations run once per process; later calls, made
+    on every Streamlit rerun, return immediately.
+    """
+
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        with scoped_connection() as conn:
+            conn.execute(_CREATE_SQL)
+            columns = {
+                column["name"] for column in inspect(conn).get_columns("entities")
+            }
+            if "updated_at" not in columns:
+                conn.execute(_ADD_UPDATED_AT_SQL)
+                _repack_legacy_rows(conn)
+            if "created_at" not in columns:
+                conn.execute(_ADD_CREATED_AT_SQL)
+                _backfill_created_at(conn)
+                conn.execute(_DROP_LEGACY_TYPE_INDEX_SQL)
+            conn.execute(_CREATE_TYPE_INDEX_SQL)
+            conn.commit()
+        _schema_ready = True
+
+
+def _repack_legacy_rows(conn) -> None:
+    """Rewrite rows stored before ``updated_at`` existed in compact form.
+
+    Older releases stored payloads with the stdlib's spaced separators; this
+    one-shot migration re-serialises them and stamps them. Rows that cannot
+    be decoded, or whose compact form would not read back identically, are
+    left untouched.
+    """
+
+    result = conn.execute(_SELECT_LEGACY_SQL)
+    stamp = time.time_ns()
+    params = []
+    for row in iter_rows(result):
+        try:
+            # Legacy rows were written by the stdlib, whose parser reads them
+            # back exactly; orjson would already round oversized integers.
+            data = json.loads(row["data"])
+            packed = _dumps(data)
+            if json.loads(packed) != data:
+                continue
+        except (TypeError, ValueError):
+            continue
+        params.append({"id": row["id"], "data": packed, "updated_at": stamp})
+    if params:
+        conn.execute(_REPACK_SQL, params)
+
+
+def _backfill_created_at(conn) -> None:
+    """Copy ``created_at`` out of the payload of rows stored before the column.
+
+    Rows whose payload cannot be decoded keep a ``NULL`` ``created_at``.
+    """
+
+    result = conn.execute(_SELECT_ALL_DATA_SQL)
+    params = []
+    for row in iter_rows(result):
+        try:
+            data = _loads(row["data"])
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            params.append({"id": row["id"], "created_at": data.get("created_at")})
+    if params:
+        conn.execute(_BACKFILL_CREATED_AT_SQL, params)
 
 
 def save_entity(entity_type: str, entity_id: str, data: Dict) -> None:
     """Persist an entity using an upsert semantics."""
 
-    upsert_sql = text(
-        """
-        INSERT INTO entities (id, entity_type, data)
-        VALUES (:id, :etype, :data)
-        ON CONFLICT(id) DO UPDATE
-            SET entity_type = EXCLUDED.entity_type,
-                data = EXCLUDED.data
-        """
-    )
-    with get_db_connection() as conn:
+    _parsed_cache.pop(entity_id, None)
+    with autocommit_connection() as conn:
         conn.execute(
-            upsert_sql,
+            _upsert_statement(conn.dialect.name),
             {
                 "id": entity_id,
-                "etype": entity_type,
-                "data": json.dumps(data),
+                "entity_type": entity_type,
+                "data": _dumps(data),
+                "updated_at": time.time_ns(),
+                "created_at": data.get("created_at"),
             },
         )
-        conn.commit()
+    _bump_generation()
 
 
-def load_entities(entity_type: str) -> List[Tuple[str, Dict]]:
-    """Return raw entities stored for the given type."""
+def _decode_row(row) -> Dict:
+    """Return the payload of ``row``, skipping the JSON parse when unchanged.
 
-    query = text("SELECT id, data FROM entities WHERE entity_type = :etype")
-    with get_db_connection() as conn:
+    The result is a shallow copy so loaders may pop keys freely; nested
+    containers are shared with the cache and must be copied before being
+    mutated in place.
+    """
+
+    entity_id = row["id"]
+    raw = row["data"]
+    cached = _parsed_cache.get(entity_id)
+    if cached is not None and cached[0] == raw:
+        data = cached[1]
+    else:
+        data = _loads(raw)
+        _parsed_cache[entity_id] = (raw, data)
+    return dict(data)
+
+
+def load_entities(
+    entity_type: str, newest_first: bool = False, cache: bool = True
+) -> List[Tuple[str, Dict]]:
+    """Return raw entities stored for the given type ordered by ``created_at``.
+
+    Pass ``cache=False`` for large, rarely re-read payloads so they are not
+    kept in the process-wide parse cache.
+    """
+
+    query = _SELECT_BY_TYPE_DESC_SQL if newest_first else _SELECT_BY_TYPE_SQL
+    with scoped_connection() as conn:
         result = conn.execute(query, {"etype": entity_type})
         rows = list(iter_rows(result))
-    return [(row["id"], json.loads(row["data"])) for row in rows]
+    if not cache:
+        return [(row["id"], _loads(row["data"])) for row in rows]
+    return [(row["id"], _decode_row(row)) for row in rows]
+
+
+def load_entities_grouped() -> Dict[str, List[Tuple[str, Dict]]]:
+    """Return the entities used by the app bucketed by type in a single query.
+
+    Each bucket is ordered by ``created_at``.
+    """
+
+    grouped: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
+    with scoped_connection() as conn:
+        result = conn.execute(
+            _SELECT_GROUPED_SQL, {"etypes": list(_GROUPED_ENTITY_TYPES)}
+        )
+        for row in iter_rows(result):
+            grouped[row["entity_type"]].append((row["id"], _decode_row(row)))
+    return grouped
 
 
 def delete_entity(entity_type: str, entity_id: str) -> None:
     """Remove an entity from the database."""
 
-    delete_sql = text(
-        """
-        DELETE FROM entities
-        WHERE id = :id AND entity_type = :etype
-        """
-    )
-    with get_db_connection() as conn:
-        conn.execute(delete_sql, {"id": entity_id, "etype": entity_type})
-        conn.commit()
+    _parsed_cache.pop(entity_id, None)
+    with autocommit_connection() as conn:
+        conn.execute(_DELETE_SQL, {"id": entity_id, "etype": entity_type})
+    _bump_generation()
 
 
 def save_tools_state(enabled_tools: Dict[str, bool]) -> None:
@@ -100,10 +395,11 @@ def save_tools_state(enabled_tools: Dict[str, bool]) -> None:
     save_entity("tools_state", "enabled_tools", data)
 
 
-def load_tools_state() -> Dict[str, bool]:
-    rows = load_entities("tools_state")
+def load_tools_state(rows: Optional[List[Tuple[str, Dict]]] = None) -> Dict[str, bool]:
+    if rows is None:
+        rows = load_entities("tools_state")
     if rows:
-        return rows[0][1].get("enabled_tools", {})
+        return dict(rows[0][1].get("enabled_tools", {}))
     return {}
 
 
@@ -121,16 +417,21 @@ def save_knowledge_source(knowledge_source: "MyKnowledgeSource") -> None:
     save_entity("knowledge_source", knowledge_source.id, data)
 
 
-def load_knowledge_sources() -> List["MyKnowledgeSource"]:
+def load_knowledge_sources(
+    rows: Optional[List[Tuple[str, Dict]]] = None,
+) -> List["MyKnowledgeSource"]:
     from my_knowledge_source import MyKnowledgeSource
 
-    rows = load_entities("knowledge_source")
+    if rows is None:
+        rows = load_entities("knowledge_source")
     knowledge_sources = []
     for row in rows:
         data = row[1]
+        # The metadata dict is edited in place by the knowledge source page.
+        data["metadata"] = dict(data.get("metadata") or {})
         knowledge_source = MyKnowledgeSource(id=row[0], **data)
         knowledge_sources.append(knowledge_source)
-    return sorted(knowledge_sources, key=lambda source: source.created_at)
+    return knowledge_sources
 
 
 def delete_knowledge_source(knowledge_source_id: str) -> None:
@@ -155,11 +456,19 @@ def save_agent(agent: "MyAgent") -> None:
     save_entity("agent", agent.id, data)
 
 
-def load_agents(tools: Optional[Sequence["MyTool"]] = None) -> List["MyAgent"]:
+def load_agents(
+    tools: Optional[Sequence["MyTool"]] = None,
+    rows: Optional[List[Tuple[str, Dict]]] = None,
+    tool_map: Optional[Dict[str, "MyTool"]] = None,
+) -> List["MyAgent"]:
     from my_agent import MyAgent
 
-    rows = load_entities("agent")
-    tool_map = {tool.tool_id: tool for tool in (tools or load_tools())}
+    if rows is None:
+        rows = load_entities("agent")
+    if tool_map is None:
+        if tools is None:
+            tools = load_tools()
+        tool_map = {tool.tool_id: tool for tool in tools}
     agents: List[MyAgent] = []
     for row in rows:
         data = row[1]
@@ -168,7 +477,7 @@ def load_agents(tools: Optional[Sequence["MyTool"]] = None) -> List["MyAgent"]:
         agent = MyAgent(id=row[0], knowledge_source_ids=knowledge_source_ids, **data)
         agent.tools = [tool_map[tool_id] for tool_id in tool_ids if tool_id in tool_map]
         agents.append(agent)
-    return sorted(agents, key=lambda agent: agent.created_at)
+    return agents
 
 
 def delete_agent(agent_id: str) -> None:
@@ -188,18 +497,27 @@ def save_task(task: "MyTask") -> None:
     save_entity("task", task.id, data)
 
 
-def load_tasks(agents: Optional[Sequence["MyAgent"]] = None) -> List["MyTask"]:
+def load_tasks(
+    agents: Optional[Sequence["MyAgent"]] = None,
+    rows: Optional[List[Tuple[str, Dict]]] = None,
+    agents_map: Optional[Dict[str, "MyAgent"]] = None,
+) -> List["MyTask"]:
     from my_task import MyTask
 
-    rows = load_entities("task")
-    agents_dict = {agent.id: agent for agent in (agents or load_agents())}
+    if rows is None:
+        rows = load_entities("task")
+    agents_dict = agents_map
+    if agents_dict is None:
+        if agents is None:
+            agents = load_agents()
+        agents_dict = {agent.id: agent for agent in agents}
     tasks: List[MyTask] = []
     for row in rows:
         data = row[1]
         agent_id = data.pop("agent_id", None)
         task = MyTask(id=row[0], agent=agents_dict.get(agent_id), **data)
         tasks.append(task)
-    return sorted(tasks, key=lambda task: task.created_at)
+    return tasks
 
 
 def delete_task(task_id: str) -> None:
@@ -229,12 +547,24 @@ def save_crew(crew: "MyCrew") -> None:
 def load_crews(
     agents: Optional[Sequence["MyAgent"]] = None,
     tasks: Optional[Sequence["MyTask"]] = None,
+    rows: Optional[List[Tuple[str, Dict]]] = None,
+    agents_map: Optional[Dict[str, "MyAgent"]] = None,
+    tasks_map: Optional[Dict[str, "MyTask"]] = None,
 ) -> List["MyCrew"]:
     from my_crew import MyCrew
 
-    rows = load_entities("crew")
-    agents_dict = {agent.id: agent for agent in (agents or load_agents())}
-    tasks_dict = {task.id: task for task in (tasks or load_tasks())}
+    if rows is None:
+        rows = load_entities("crew")
+    agents_dict = agents_map
+    if agents_dict is None:
+        if agents is None:
+            agents = load_agents()
+        agents_dict = {agent.id: agent for agent in agents}
+    tasks_dict = tasks_map
+    if tasks_dict is None:
+        if tasks is None:
+            tasks = load_tasks(agents_map=agents_dict)
+        tasks_dict = {task.id: task for task in tasks}
     crews: List[MyCrew] = []
     for row in rows:
         data = row[1]
@@ -254,13 +584,13 @@ def load_crews(
             knowledge_source_ids=data.get("knowledge_source_ids", []),
         )
         crew.agents = [
-            agents_dict[agent_id] for agent_id in data["agent_ids"] if agent_id in agents_dict
+            agent for agent in map(agents_dict.get, data["agent_ids"]) if agent is not None
         ]
         crew.tasks = [
-            tasks_dict[task_id] for task_id in data["task_ids"] if task_id in tasks_dict
+            task for task in map(tasks_dict.get, data["task_ids"]) if task is not None
         ]
         crews.append(crew)
-    return sorted(crews, key=lambda crew: crew.created_at)
+    return crews
 
 
 def delete_crew(crew_id: str) -> None:
@@ -276,14 +606,27 @@ def save_tool(tool: "MyTool") -> None:
     save_entity("tool", tool.tool_id, data)
 
 
-def load_tools() -> List["MyTool"]:
-    from my_tools import TOOL_CLASSES
+# Resolved on first use: ``my_tools`` pulls in the heavy ``crewai_tools`` stack.
+_TOOL_CLASSES: Optional[Dict[str, type]] = None
+
+
+def _tool_classes() -> Dict[str, type]:
+    global _TOOL_CLASSES
+    if _TOOL_CLASSES is None:
+        from my_tools import TOOL_CLASSES
+
+        _TOOL_CLASSES = TOOL_CLASSES
+    return _TOOL_CLASSES
 
-    rows = load_entities("tool")
+
+def load_tools(rows: Optional[List[Tuple[str, Dict]]] = None) -> List["MyTool"]:
+    if rows is None:
+        rows = load_entities("tool")
+    tool_classes = _tool_classes()
     tools: List[MyTool] = []
     for row in rows:
         data = row[1]
-        tool_class = TOOL_CLASSES[data["name"]]
+        tool_class = tool_classes[data["name"]]
         tool = tool_class(tool_id=row[0])
         tool.set_parameters(**data["parameters"])
         tools.append(tool)
@@ -295,47 +638,51 @@ def delete_tool(tool_id: str) -> None:
 
 
 def export_to_json(file_path: str) -> None:
-    with get_db_connection() as conn:
-        query = text("SELECT * FROM entities")
-        result = conn.execute(query)
-        rows = [
-            {
-                "id": row["id"],
-                "entity_type": row["entity_type"],
-                "data": json.loads(row["data"]),
-            }
-            for row in iter_rows(result)
-        ]
-
-    with open(file_path, "w", encoding="utf-8") as file_obj:
-        json.dump(rows, file_obj, indent=4)
+    # Rows are written as they are fetched so memory use does not grow with
+    # the size of the database. The stored payload is already JSON text, so it
+    # is spliced in verbatim rather than parsed and re-serialised.
+    with open(file_path, "w", encoding="utf-8") as file_obj, scoped_connection() as conn:
+        result = conn.execute(_EXPORT_SQL)
+        file_obj.write("[")
+        separator = "\n"
+        for row in iter_rows(result):
+            header = _dumps({"id": row["id"], "entity_type": row["entity_type"]})
+            file_obj.write(separator)
+            file_obj.write(header[:-1])
+            file_obj.write(',"data":')
+            file_obj.write(row["data"])
+            file_obj.write("}")
+            separator = ",\n"
+        file_obj.write("\n]\n")
 
 
 def import_from_json(file_path: str) -> None:
-    with open(file_path, "r", encoding="utf-8") as file_obj:
-        data = json.load(file_obj)
+    with open(file_path, "rb") as file_obj:
+        data = _loads(file_obj.read())
+
+    updated_at = time.time_ns()
+    params = (
+        {
+            "id": entity["id"],
+            "entity_type": entity["entity_type"],
+            "data": _dumps(entity["data"]),
+            "updated_at": updated_at,
+            "created_at": entity["data"].get("created_at"),
+        }
+        for entity in data
+    )
 
     with get_db_connection() as conn:
-        upsert_sql = text(
-            """
-            INSERT INTO entities (id, entity_type, data)
-            VALUES (:id, :etype, :data)
-            ON CONFLICT(id) DO UPDATE
-                SET entity_type = EXCLUDED.entity_type,
-                    data = EXCLUDED.data
-            """
-        )
-
-        for entity in data:
-            conn.execute(
-                upsert_sql,
-                {
-                    "id": entity["id"],
-                    "etype": entity["entity_type"],
-                    "data": json.dumps(entity["data"]),
-                },
-            )
-        conn.commit()
+        upsert = _upsert_statement(conn.dialect.name)
+        with conn.begin():
+            # One executemany per batch keeps memory bounded on large imports.
+            while True:
+                batch = list(islice(params, IMPORT_BATCH_SIZE))
+                if not batch:
+                    break
+                conn.execute(upsert, batch)
+    _parsed_cache.clear()
+    _bump_generation()
 
 
 def save_result(result: "Result") -> None:
@@ -352,7 +699,8 @@ def save_result(result: "Result") -> None:
 def load_results() -> List["Result"]:
     from result import Result
 
-    rows = load_entities("result")
+    # Results hold full crew outputs, so keep them out of the parse cache.
+    rows = load_entities("result", newest_first=True, cache=False)
     results: List[Result] = []
     for row in rows:
         data = row[1]
@@ -366,7 +714,7 @@ def load_results() -> List["Result"]:
                 created_at=data["created_at"],
             )
         )
-    return sorted(results, key=lambda result: result.created_at, reverse=True)
+    return results
 
 
 def delete_result(result_id: str) -> None:
@@ -374,13 +722,35 @@ def delete_result(result_id: str) -> None:
 
 
 def load_all_entities() -> LoadedEntities:
-    """Load all persisted entities ensuring minimal repeated queries."""
-
-    tools = load_tools()
-    knowledge_sources = load_knowledge_sources()
-    agents = load_agents(tools=tools)
-    tasks = load_tasks(agents=agents)
-    crews = load_crews(agents=agents, tasks=tasks)
+    """Load all persisted entities ensuring minimal repeated queries.
+
+    On SQLite the raw rows are reused across sessions while
+    :func:`entities_version` is unchanged; the entity objects themselves are
+    always rebuilt so sessions never share them.
+    """
+
+    global _grouped_cache
+    version = entities_version()
+    cached = _grouped_cache
+    if version[1] is not None and cached is not None and cached[0] == version:
+        rows_by_type = cached[1]
+    else:
+        rows_by_type = load_entities_grouped()
+        _grouped_cache = (version, rows_by_type)
+    # Loaders pop keys from the payloads, so hand them copies of the rows.
+    grouped: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
+    for entity_type, rows in rows_by_type.items():
+        grouped[entity_type] = [(entity_id, dict(data)) for entity_id, data in rows]
+    tools = load_tools(rows=grouped["tool"])
+    knowledge_sources = load_knowledge_sources(rows=grouped["knowledge_source"])
+    tool_map = {tool.tool_id: tool for tool in tools}
+    agents = load_agents(rows=grouped["agent"], tool_map=tool_map)
+    agents_map = {agent.id: agent for agent in agents}
+    tasks = load_tasks(rows=grouped["task"], agents_map=agents_map)
+    tasks_map = {task.id: task for task in tasks}
+    crews = load_crews(
+        rows=grouped["crew"], agents_map=agents_map, tasks_map=tasks_map
+    )
 
     return LoadedEntities(
         agents=agents,
@@ -388,4 +758,5 @@ def load_all_entities() -> LoadedEntities:
         crews=crews,
         tools=tools,
         knowledge_sources=knowledge_sources,
+        enabled_tools=load_tools_state(rows=grouped["tools_state"]),
     )
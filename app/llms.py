@@ -9,8 +9,8 @@ from langchain_openai.chat_models.base import BaseChatOpenAI
 from litellm import completion
 
 def load_secrets_fron_env():
-    load_dotenv(override=True)
     if "env_vars" not in st.session_state:
+        load_dotenv(override=True)
         st.session_state.env_vars = {
             "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
             "OPENAI_API_BASE": os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1/"),
@@ -210,9 +210,6 @@ class PageCrewRun:
         return str(result)
 
     def display_result(self):
-        if ss.running and ss.page != "Kickoff!":
-            ss.page = "Kickoff!"
-            st.rerun()
         console_container = st.empty()
         
         with console_container.container():
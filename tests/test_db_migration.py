@@ -0,0 +1,112 @@
+"""Migration of databases created by releases before the schema changes."""
+
+import json
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "app"))
+
+from core import config, database  # noqa: E402
+import db_utils  # noqa: E402
+
+BASELINE_ROWS = [
+    ("ok", "agent", json.dumps({"role": "r", "created_at": "2024-01-01"})),
+    ("big", "agent", json.dumps({"n": 2**70, "created_at": "2024-03-01"})),
+    (
+        "nan",
+        "result",
+        json.dumps({"result": {"score": float("nan")}, "created_at": "2024-02-01"}),
+    ),
+    ("bad", "tool", "{oops"),
+    ("list", "tools_state", json.dumps([1, 2])),
+]
+
+
+class BaselineMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "crewai.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "CREATE TABLE entities (id TEXT PRIMARY KEY, entity_type TEXT, data TEXT)"
+            )
+            conn.execute("CREATE INDEX idx_entities_type ON entities (entity_type)")
+            conn.executemany("INSERT INTO entities VALUES (?, ?, ?)", BASELINE_ROWS)
+
+        os.environ["DB_URL"] = f"sqlite:///{self.db_path}"
+        self._reset_state()
+
+    def tearDown(self):
+        if database._version_conn is not None:
+            database._version_conn.close()
+        database.get_engine().dispose()
+        self._reset_state()
+        os.environ.pop("DB_URL", None)
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _reset_state():
+        config.load_settings.cache_clear()
+        database.get_engine.cache_clear()
+        database._ENGINE = None
+        database._version_conn = None
+        db_utils._schema_ready = False
+        db_utils._parsed_cache.clear()
+        db_utils._grouped_cache = None
+
+    def _rows(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT id, data, updated_at, created_at FROM entities")
+            return {row["id"]: dict(row) for row in rows}
+
+    def test_baseline_database_migrates(self):
+        db_utils.initialize_db()
+        db_utils.initialize_db()
+
+        with sqlite3.connect(self.db_path) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+        self.assertNotIn("idx_entities_type", indexes)
+        self.assertIn("idx_entities_type_created", indexes)
+
+        rows = self._rows()
+        original = {entity_id: data for entity_id, _, data in BASELINE_ROWS}
+
+        self.assertEqual(rows["ok"]["data"], '{"role":"r","created_at":"2024-01-01"}')
+        self.assertIsNotNone(rows["ok"]["updated_at"])
+        self.assertEqual(rows["ok"]["created_at"], "2024-01-01")
+
+        self.assertEqual(rows["big"]["data"], '{"n":%d,"created_at":"2024-03-01"}' % 2**70)
+
+        self.assertEqual(
+            rows["nan"]["data"], '{"result":{"score":NaN},"created_at":"2024-02-01"}'
+        )
+        self.assertEqual(rows["nan"]["created_at"], "2024-02-01")
+
+        self.assertEqual(rows["bad"]["data"], original["bad"])
+        self.assertIsNone(rows["bad"]["updated_at"])
+        self.assertIsNone(rows["bad"]["created_at"])
+
+        self.assertIsNone(rows["list"]["created_at"])
+
+    def test_migrated_rows_load_unchanged(self):
+        db_utils.initialize_db()
+
+        agents = dict(db_utils.load_entities("agent"))
+        self.assertEqual(agents["ok"], {"role": "r", "created_at": "2024-01-01"})
+        self.assertEqual(agents["big"]["n"], 2**70)
+
+        (result_id, result), = db_utils.load_entities("result", cache=False)
+        self.assertEqual(result_id, "nan")
+        self.assertTrue(math.isnan(result["result"]["score"]))
+
+
+if __name__ == "__main__":
+    unittest.main()